@@ -0,0 +1,10 @@
+"""
+Skillio text helpers
+
+Small formatting helpers shared by the CLI and the core modules.
+"""
+
+
+def bullet_list(items) -> str:
+    """Render items as a markdown bullet list."""
+    return "\n".join(map("- {}".format, items))
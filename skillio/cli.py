@@ -8,26 +8,109 @@ Usage:
     skillio info video-downloader
 """
 
+import string
+from contextlib import nullcontext
+from typing import Optional
+
 import click
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.markdown import Markdown
+from rich.markup import escape
+
+from skillio._text import bullet_list
+
+# Rich renderables (Table, Panel, Markdown) and the skillio.core subsystems
+# are imported inside the commands that need them to keep startup fast.
+
+
+class BufferedConsole(Console):
+    """Rich console that coalesces consecutive lines into a single print.
+
+    Every ``print`` call pays Rich's markup/layout overhead, so multi-line
+    blocks are collected with ``write``/``writeln`` and rendered in one go
+    by ``flush``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._line_buffer: list = []
+
+    def write(self, text: str) -> None:
+        """Append text to the pending buffer without a newline."""
+        self._line_buffer.append(text)
+
+    def writeln(self, text: str = "") -> None:
+        """Append a full line to the pending buffer."""
+        self._line_buffer.append(text)
+        self._line_buffer.append("\n")
+
+    def flush(self) -> None:
+        """Render everything buffered so far with a single print."""
+        if not self._line_buffer:
+            return
+        text = "".join(self._line_buffer)
+        self._line_buffer.clear()
+        super().print(text, end="")
+
+
+_console: Optional[BufferedConsole] = None
+
+# Shared click parameter types, built once at import
+_SCOPE_CHOICE = click.Choice(("project", "global"))
 
-from skillio.core.search import search_skills, get_skill_info
-from skillio.core.install import (
-    install_skill, 
-    list_installed, 
-    remove_skill,
-    detect_ai_environments
-)
 
-console = Console()
+# Markdown body of the `skillio info` panel
+_INFO_TEMPLATE = string.Template("""
+# ${name} v${version}
+
+${description}
+
+## Capabilities
+${capabilities}
+
+## Usage Scenarios
+${scenarios}
+
+## Source
+- Type: ${source_type}
+- Repo: ${source_repo}
+
+## Dependencies
+${dependencies}
+
+## Quality Score: ${quality_score}/10
+""")
+
+
+def _is_terminal() -> bool:
+    """Whether output goes to a terminal, as detected once at CLI entry.
+    
+    When it does not (e.g. piped into another program), commands skip
+    Rich tables and emit plain tab-separated lines instead.
+    """
+    ctx = click.get_current_context(silent=True)
+    obj = ctx.find_object(dict) if ctx is not None else None
+    if obj is None or "is_terminal" not in obj:
+        return _get_console().is_terminal
+    return obj["is_terminal"]
+
+
+def _trunc(text: str, n: int = 50) -> str:
+    """Truncate text to n characters, adding an ellipsis if it was cut."""
+    return f"{text[:n]}..." if len(text) > n else text
+
+
+def _get_console() -> BufferedConsole:
+    """Return the shared CLI console, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = BufferedConsole()
+    return _console
 
 
 @click.group()
 @click.version_option(version="0.1.0", prog_name="skillio")
-def main():
+@click.pass_context
+def main(ctx: click.Context):
     """Skillio - AI Agent's capability discovery and assembly hub.
     
     Find and install AI skills using natural language.
@@ -36,7 +119,7 @@ def main():
         skillio search "download YouTube video"
         skillio install video-downloader
     """
-    pass
+    ctx.ensure_object(dict)["is_terminal"] = _get_console().is_terminal
 
 
 @main.command()
@@ -52,7 +135,15 @@ def search(query: str, keyword: bool, limit: int, as_json: bool):
         skillio search "PDF to Word"
         skillio search --keyword video
     """
-    console.print(f"\n🔍 Searching for: [bold cyan]{query}[/bold cyan]\n")
+    from rich.table import Table
+    
+    from skillio.core.search import search_skills
+    
+    console = _get_console()
+    tty = _is_terminal()
+    
+    if tty:
+        console.print(f"\n🔍 Searching for: [bold cyan]{query}[/bold cyan]\n")
     
     results = search_skills(query, keyword_mode=keyword, limit=limit)
     
@@ -66,6 +157,14 @@ def search(query: str, keyword: bool, limit: int, as_json: bool):
         click.echo(json.dumps(results, indent=2))
         return
     
+    if not tty:
+        for s in results:
+            click.echo(
+                f"{s['name']}\t{s['description']}\t{s.get('match_score', 0):.1f}"
+                f"\t{s.get('source', {}).get('repo', 'N/A')}"
+            )
+        return
+    
     # Display results
     table = Table(title=f"Found {len(results)} matching skills")
     table.add_column("Skill", style="cyan", no_wrap=True)
@@ -73,20 +172,26 @@ def search(query: str, keyword: bool, limit: int, as_json: bool):
     table.add_column("Score", justify="right", style="green")
     table.add_column("Source", style="dim")
     
-    for skill in results:
-        table.add_row(
-            skill["name"],
-            skill["description"][:50] + "..." if len(skill["description"]) > 50 else skill["description"],
-            f"{skill.get('match_score', 0):.1f}",
-            skill.get("source", {}).get("repo", "N/A")
+    rows = [
+        (
+            s["name"],
+            _trunc(s["description"]),
+            f"{s.get('match_score', 0):.1f}",
+            s.get("source", {}).get("repo", "N/A")
         )
+        for s in results
+    ]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
     # Show recommended action
     if results:
         top_skill = results[0]["name"]
-        console.print(f"\n💡 [bold]Recommended:[/bold] skillio install {top_skill}")
+        console.writeln()
+        console.writeln(f"💡 [bold]Recommended:[/bold] skillio install {top_skill}")
+        console.flush()
 
 
 @main.command()
@@ -95,9 +200,12 @@ def search(query: str, keyword: bool, limit: int, as_json: bool):
 @click.option("--force", "-f", is_flag=True, help="Force reinstall if already installed")
 @click.option("--no-seekers", is_flag=True, help="Skip skill-seekers, use simple generation")
 @click.option("--no-enhance", is_flag=True, help="Skip AI enhancement step")
-@click.option("--scope", type=click.Choice(["project", "global"]), default=None, 
+@click.option("--install-seekers", is_flag=True,
+              help="Install skill-seekers with pip if it is missing")
+@click.option("--scope", type=_SCOPE_CHOICE, default=None, 
               help="Install scope: project (.cursor/skills/) or global (~/.cursor/skills/)")
-def install(skill_name: str, target: str, force: bool, no_seekers: bool, no_enhance: bool, scope: str):
+def install(skill_name: str, target: str, force: bool, no_seekers: bool, no_enhance: bool,
+            install_seekers: bool, scope: str):
     """Install a skill using skill-seekers for high-quality generation.
     
     Examples:
@@ -106,6 +214,11 @@ def install(skill_name: str, target: str, force: bool, no_seekers: bool, no_enha
         skillio install video-downloader --no-seekers
         skillio install video-downloader --target ~/.cursor/skills/
     """
+    from skillio.core.install import detect_ai_environments, install_skill
+    from skillio.core.search import get_skill_info
+    
+    console = _get_console()
+    
     # Get skill info first
     skill_info = get_skill_info(skill_name)
     if not skill_info:
@@ -116,64 +229,78 @@ def install(skill_name: str, target: str, force: bool, no_seekers: bool, no_enha
     source = skill_info.get("source", {})
     repo = source.get("repo", "N/A")
     
-    console.print(f"\n📦 Installing skill: [bold cyan]{skill_name}[/bold cyan]")
-    console.print(f"   Source: [dim]{source.get('type', 'unknown')}[/dim] - [dim]{repo}[/dim]")
-    
     # Determine target based on scope
     if scope and not target:
-        envs = detect_ai_environments()
-        for env in envs:
-            if env["scope"] == scope and env["type"] == "cursor":
-                target = str(env["path"])
-                break
+        envs = detect_ai_environments(filter_type="cursor", filter_scope=scope)
+        if envs:
+            target = str(envs[0]["path"])
+    
+    # Render the whole header with a single print
+    console.writeln()
+    console.writeln(f"📦 Installing skill: [bold cyan]{skill_name}[/bold cyan]")
+    console.writeln(f"   Source: [dim]{source.get('type', 'unknown')}[/dim] - [dim]{repo}[/dim]")
     
     # Show installation method
     if no_seekers:
-        console.print("   Method: [yellow]Simple (SKILL.md only)[/yellow]")
+        console.writeln("   Method: [yellow]Simple (SKILL.md only)[/yellow]")
     else:
-        console.print("   Method: [green]skill-seekers (full Skill with docs & scripts)[/green]")
+        console.writeln("   Method: [green]skill-seekers (full Skill with docs & scripts)[/green]")
         if not no_enhance:
-            console.print("   Enhancement: [green]AI-enhanced[/green]")
+            console.writeln("   Enhancement: [green]AI-enhanced[/green]")
     
-    console.print("")
+    console.writeln()
+    console.flush()
     
     try:
-        with console.status("[bold green]Generating skill...", spinner="dots"):
+        # Don't animate a spinner nobody can see
+        status = (
+            console.status("[bold green]Generating skill...", spinner="dots")
+            if _is_terminal() else nullcontext()
+        )
+        with status:
             result = install_skill(
                 skill_name, 
                 target=target, 
                 force=force,
                 use_skill_seekers=not no_seekers,
-                enhance=not no_enhance
+                enhance=not no_enhance,
+                install_seekers=install_seekers,
+                skill=skill_info
             )
         
         if result["success"]:
-            console.print(f"✅ [bold green]Successfully installed {skill_name}![/bold green]")
-            console.print(f"   Location: {result['path']}")
-            console.print(f"   Method: {result.get('method', 'unknown')}")
+            console.writeln(f"✅ [bold green]Successfully installed {skill_name}![/bold green]")
+            console.writeln(f"   Location: {result['path']}")
+            console.writeln(f"   Method: {result.get('method', 'unknown')}")
+            if result.get("note"):
+                console.writeln(f"   [yellow]Note:[/yellow] {escape(result['note'])}")
             
             # Show generated contents
             contents = result.get("contents", [])
             if contents:
-                console.print(f"\n📁 [bold]Generated files:[/bold]")
+                console.writeln()
+                console.writeln("📁 [bold]Generated files:[/bold]")
                 for item in contents[:10]:
-                    console.print(f"   ├── {item}")
+                    console.writeln(f"   ├── {item}")
                 if len(contents) > 10:
-                    console.print(f"   └── ... and {len(contents) - 10} more files")
+                    console.writeln(f"   └── ... and {len(contents) - 10} more files")
             
             # Show usage hint
             if skill_info.get("scenarios"):
-                console.print(f"\n💡 [bold]Try it:[/bold]")
+                console.writeln()
+                console.writeln("💡 [bold]Try it:[/bold]")
                 for scenario in skill_info["scenarios"][:2]:
-                    console.print(f"   - {scenario}")
+                    console.writeln(f"   - {scenario}")
+            
+            console.flush()
         else:
-            console.print(f"\n❌ [bold red]Installation failed:[/bold red] {result.get('error', 'Unknown error')}")
+            console.print(f"\n❌ [bold red]Installation failed:[/bold red] {escape(result.get('error', 'Unknown error'))}")
             
             # Suggest fallback
             if "skill-seekers" in result.get("error", ""):
                 console.print("\n💡 [bold]Tip:[/bold] Try with --no-seekers flag for simple installation")
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error:[/bold red] {str(e)}")
+        console.print(f"\n❌ [bold red]Error:[/bold red] {escape(str(e))}")
 
 
 @main.command()
@@ -187,12 +314,20 @@ def list(show_all: bool, category: str):
         skillio list --all
         skillio list --category media
     """
+    from rich.table import Table
+    
+    console = _get_console()
+    tty = _is_terminal()
+    
     if show_all:
-        console.print("\n📚 [bold]All Available Skills[/bold]\n")
+        if tty:
+            console.print("\n📚 [bold]All Available Skills[/bold]\n")
         from skillio.core.search import get_all_skills
         skills = get_all_skills(category=category)
     else:
-        console.print("\n📦 [bold]Installed Skills[/bold]\n")
+        if tty:
+            console.print("\n📦 [bold]Installed Skills[/bold]\n")
+        from skillio.core.install import list_installed
         skills = list_installed()
     
     if not skills:
@@ -203,17 +338,19 @@ def list(show_all: bool, category: str):
             console.print("Try: skillio search \"your need\" to find skills")
         return
     
+    if not tty:
+        for s in skills:
+            click.echo(f"{s['name']}\t{s.get('version', 'N/A')}\t{s['description']}")
+        return
+    
     table = Table()
     table.add_column("Skill", style="cyan")
     table.add_column("Version", style="dim")
     table.add_column("Description", style="white")
     
-    for skill in skills:
-        table.add_row(
-            skill["name"],
-            skill.get("version", "N/A"),
-            skill["description"][:60] + "..." if len(skill["description"]) > 60 else skill["description"]
-        )
+    rows = [(s["name"], s.get("version", "N/A"), _trunc(s["description"], 60)) for s in skills]
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print(f"\nTotal: {len(skills)} skills")
@@ -227,6 +364,13 @@ def info(skill_name: str):
     Example:
         skillio info video-downloader
     """
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+    
+    from skillio.core.search import get_skill_info
+    
+    console = _get_console()
+    
     skill = get_skill_info(skill_name)
     
     if not skill:
@@ -235,26 +379,18 @@ def info(skill_name: str):
         return
     
     # Build info panel
-    info_text = f"""
-# {skill['name']} v{skill.get('version', 'N/A')}
-
-{skill['description']}
-
-## Capabilities
-{chr(10).join('- ' + cap for cap in skill.get('capabilities', []))}
-
-## Usage Scenarios
-{chr(10).join('- ' + s for s in skill.get('scenarios', [])[:5])}
-
-## Source
-- Type: {skill.get('source', {}).get('type', 'N/A')}
-- Repo: {skill.get('source', {}).get('repo', 'N/A')}
-
-## Dependencies
-{chr(10).join('- ' + dep for dep in skill.get('dependencies', [])) or '- None'}
-
-## Quality Score: {skill.get('quality_score', 'N/A')}/10
-"""
+    source = skill.get("source", {})
+    info_text = _INFO_TEMPLATE.substitute(
+        name=skill["name"],
+        version=skill.get("version", "N/A"),
+        description=skill["description"],
+        capabilities=bullet_list(skill.get("capabilities", ())),
+        scenarios=bullet_list(skill.get("scenarios", ())[:5]),
+        source_type=source.get("type", "N/A"),
+        source_repo=source.get("repo", "N/A"),
+        dependencies=bullet_list(skill.get("dependencies", ())) or "- None",
+        quality_score=skill.get("quality_score", "N/A")
+    )
     
     console.print(Panel(Markdown(info_text), title=f"Skill: {skill_name}", border_style="cyan"))
 
@@ -268,6 +404,10 @@ def remove(skill_name: str, force: bool):
     Example:
         skillio remove video-downloader
     """
+    from skillio.core.install import remove_skill
+    
+    console = _get_console()
+    
     if not force:
         if not click.confirm(f"Are you sure you want to remove {skill_name}?"):
             console.print("Cancelled.")
@@ -278,18 +418,27 @@ def remove(skill_name: str, force: bool):
         if result["success"]:
             console.print(f"\n✅ [bold green]Successfully removed {skill_name}[/bold green]")
         else:
-            console.print(f"\n❌ [bold red]Failed to remove:[/bold red] {result.get('error', 'Unknown error')}")
+            console.print(f"\n❌ [bold red]Failed to remove:[/bold red] {escape(result.get('error', 'Unknown error'))}")
     except Exception as e:
-        console.print(f"\n❌ [bold red]Error:[/bold red] {str(e)}")
+        console.print(f"\n❌ [bold red]Error:[/bold red] {escape(str(e))}")
 
 
 @main.command()
 def categories():
     """Show available skill categories."""
+    from rich.table import Table
+    
     from skillio.core.search import get_categories
     
+    console = _get_console()
+    
     cats = get_categories()
     
+    if not _is_terminal():
+        for cat in cats:
+            click.echo(f"{cat['name']}\t{cat['count']}\t{', '.join(cat['examples'][:3])}")
+        return
+    
     console.print("\n📁 [bold]Skill Categories[/bold]\n")
     
     table = Table()
@@ -310,9 +459,20 @@ def categories():
 @main.command()
 def environments():
     """Detect and show available AI environments for skill installation."""
+    from rich.table import Table
+    
+    from skillio.core.install import detect_ai_environments
+    
+    console = _get_console()
     
     envs = detect_ai_environments()
     
+    if not _is_terminal():
+        for env in envs:
+            status = "exists" if env.get("exists") else "will create"
+            click.echo(f"{env['type']}\t{env['scope']}\t{env['path']}\t{status}")
+        return
+    
     console.print("\n🔍 [bold]Detected AI Environments[/bold]\n")
     
     table = Table()
@@ -337,9 +497,12 @@ def environments():
     # Show recommendation
     if envs:
         recommended = envs[0]
-        console.print(f"\n💡 [bold]Recommended:[/bold] {recommended['type']} ({recommended['scope']})")
-        console.print(f"   Path: {recommended['path']}")
-        console.print(f"\n   Use: skillio install <skill> --scope {recommended['scope']}")
+        console.writeln()
+        console.writeln(f"💡 [bold]Recommended:[/bold] {recommended['type']} ({recommended['scope']})")
+        console.writeln(f"   Path: {recommended['path']}")
+        console.writeln()
+        console.writeln(f"   Use: skillio install <skill> --scope {recommended['scope']}")
+        console.flush()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,18 @@
 """Skillio core modules."""
 
-from skillio.core.search import search_skills, get_skill_info, get_all_skills
-from skillio.core.install import (
-    install_skill, 
-    list_installed, 
-    remove_skill,
-    detect_ai_environments
-)
+import importlib
+
+# Public names are resolved lazily (PEP 562) so that importing one subsystem
+# does not pull in the other.
+_LAZY_ATTRS = {
+    "search_skills": "skillio.core.search",
+    "get_skill_info": "skillio.core.search",
+    "get_all_skills": "skillio.core.search",
+    "install_skill": "skillio.core.install",
+    "list_installed": "skillio.core.install",
+    "remove_skill": "skillio.core.install",
+    "detect_ai_environments": "skillio.core.install",
+}
 
 __all__ = [
     "search_skills",
@@ -17,3 +23,16 @@ __all__ = [
     "remove_skill",
     "detect_ai_environments",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,16 +6,44 @@ Integrates with skill-seekers for high-quality Skill generation.
 """
 
 import os
+import sys
+import errno
 import json
 import shutil
-import subprocess
+import string
 import tempfile
+import functools
+import importlib
+import importlib.util
+import itertools
+import subprocess
 from pathlib import Path
 from typing import Optional, List
 
-from skillio.core.search import get_skill_info
+from skillio._text import bullet_list
+from skillio.core.search import get_skill_info, get_skill_infos
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None
+
+
+def _json_loads(data: bytes):
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
 
+
+@functools.lru_cache(maxsize=1)
 def _get_default_install_path() -> Path:
     """Get the default skill installation path.
     
@@ -24,6 +52,8 @@ def _get_default_install_path() -> Path:
     2. Project-level .cursor/skills/ (if in a Cursor project)
     3. ~/.cursor/skills/ (Cursor IDE global)
     4. ~/.skillio/skills/ (standalone)
+    
+    Cached for the lifetime of the process (see _reset_path_cache()).
     """
     # Check env var
     env_path = os.environ.get("SKILLIO_INSTALL_PATH")
@@ -46,114 +76,176 @@ def _get_default_install_path() -> Path:
     return Path.home() / ".skillio" / "skills"
 
 
+@functools.lru_cache(maxsize=1)
 def _find_project_root() -> Optional[Path]:
-    """Find the project root by looking for .git or .cursor directory."""
+    """Find the project root by looking for .git or .cursor directory.
+    
+    The result is cached for the lifetime of the process; call
+    _reset_path_cache() after changing the working directory.
+    """
     cwd = Path.cwd()
     
-    for parent in [cwd] + list(cwd.parents):
+    for parent in itertools.chain([cwd], cwd.parents):
         if (parent / ".git").exists() or (parent / ".cursor").exists():
             return parent
     
     return None
 
 
-def detect_ai_environments() -> List[dict]:
-    """Detect available AI environments for skill installation.
+def _reset_path_cache():
+    """Clear the cached project root, default install path and environments."""
+    _find_project_root.cache_clear()
+    _get_default_install_path.cache_clear()
+    _environment_index.cache_clear()
+
+
+# Known AI environments, in order of preference:
+# (type, scope, skills path relative to the scope's base directory,
+#  predicate deciding whether the environment is present).
+# Project-scoped paths are relative to the project root, global ones to $HOME.
+_ENV_SPECS = (
+    ("cursor", "project",
+     lambda base: base / ".cursor" / "skills",
+     lambda path, exists: exists(path.parent)),
+    ("windsurf", "project",
+     lambda base: base / ".windsurf" / "skills",
+     lambda path, exists: exists(path.parent)),
+    ("cursor", "global",
+     lambda base: base / ".cursor" / "skills",
+     lambda path, exists: exists(path.parent)),
+    # Claude Desktop (macOS)
+    ("claude_desktop", "global",
+     lambda base: base / "Library" / "Application Support" / "Claude" / "skills",
+     lambda path, exists: exists(path.parent)),
+    # Continue (VSCode extension)
+    ("continue", "global",
+     lambda base: base / ".continue" / "skills",
+     lambda path, exists: exists(path.parent)),
+    # Standalone fallback, always available
+    ("standalone", "global",
+     lambda base: base / ".skillio" / "skills",
+     lambda path, exists: True),
+)
+
+
+def _probe_environments(
+    filter_type: Optional[str] = None,
+    filter_scope: Optional[str] = None
+) -> List[dict]:
+    """Probe the filesystem for environments matching the given filters."""
+    # Stat lazily and at most once per path: an environment's skills
+    # directory is only checked once its presence predicate holds.
+    found = {}
+    
+    def exists(path: Path) -> bool:
+        if path not in found:
+            found[path] = path.exists()
+        return found[path]
     
-    Returns:
-        List of detected environments with type, scope, and path.
-    """
     environments = []
-    
-    # 1. Check project-level directories
-    project_root = _find_project_root()
-    if project_root:
-        # Cursor project
-        cursor_project = project_root / ".cursor" / "skills"
-        if cursor_project.exists():
-            environments.append({
-                "type": "cursor",
-                "scope": "project",
-                "path": cursor_project,
-                "exists": True
-            })
-        elif (project_root / ".cursor").exists():
+    for env_type, scope, path_for, is_present in _ENV_SPECS:
+        if filter_type is not None and env_type != filter_type:
+            continue
+        if filter_scope is not None and scope != filter_scope:
+            continue
+        base = _find_project_root() if scope == "project" else Path.home()
+        if base is None:
+            continue
+        path = path_for(base)
+        if is_present(path, exists):
             environments.append({
-                "type": "cursor",
-                "scope": "project", 
-                "path": cursor_project,
-                "exists": False
-            })
-        
-        # Windsurf project
-        windsurf_project = project_root / ".windsurf" / "skills"
-        if (project_root / ".windsurf").exists():
-            environments.append({
-                "type": "windsurf",
-                "scope": "project",
-                "path": windsurf_project,
-                "exists": windsurf_project.exists()
+                "type": env_type,
+                "scope": scope,
+                "path": path,
+                "exists": exists(path)
             })
     
-    # 2. Check global directories
-    # Cursor global
-    cursor_global = Path.home() / ".cursor" / "skills"
-    if cursor_global.parent.exists():
-        environments.append({
-            "type": "cursor",
-            "scope": "global",
-            "path": cursor_global,
-            "exists": cursor_global.exists()
-        })
+    return environments
+
+
+@functools.lru_cache(maxsize=1)
+def _environment_index() -> dict:
+    """All detected environments keyed by (type, scope), probed once per process."""
+    return {(env["type"], env["scope"]): env for env in _probe_environments()}
+
+
+def detect_ai_environments(
+    filter_type: Optional[str] = None,
+    filter_scope: Optional[str] = None
+) -> List[dict]:
+    """Detect available AI environments for skill installation.
     
-    # Claude Desktop (macOS)
-    claude_path = Path.home() / "Library" / "Application Support" / "Claude"
-    if claude_path.exists():
-        environments.append({
-            "type": "claude_desktop",
-            "scope": "global",
-            "path": claude_path / "skills",
-            "exists": (claude_path / "skills").exists()
-        })
+    Args:
+        filter_type: Only return environments of this type (e.g. "cursor")
+        filter_scope: Only return environments with this scope
+            ("project" or "global")
     
-    # Continue (VSCode extension)
-    continue_path = Path.home() / ".continue" / "skills"
-    if continue_path.parent.exists():
-        environments.append({
-            "type": "continue",
-            "scope": "global",
-            "path": continue_path,
-            "exists": continue_path.exists()
-        })
-    
-    # 3. Standalone fallback
-    skillio_path = Path.home() / ".skillio" / "skills"
-    environments.append({
-        "type": "standalone",
-        "scope": "global",
-        "path": skillio_path,
-        "exists": skillio_path.exists()
-    })
+    Returns:
+        List of detected environments with type, scope, and path.
+    """
+    if filter_type is None and filter_scope is None:
+        return [dict(env) for env in _environment_index().values()]
     
-    return environments
+    # Only probe the requested environments
+    return _probe_environments(filter_type, filter_scope)
 
 
+@functools.lru_cache(maxsize=1)
 def _check_skill_seekers() -> bool:
-    """Check if skill-seekers is installed."""
-    return shutil.which("skill-seekers") is not None
+    """Check if skill-seekers is installed.
+    
+    Either importable here or available as a program, e.g. installed with
+    pipx into its own environment.
+    """
+    return (
+        importlib.util.find_spec("skill_seekers") is not None
+        or _skill_seekers_executable() is not None
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _skill_seekers_executable() -> Optional[str]:
+    """Resolve the skill-seekers executable once per process.
+    
+    Falls back to the script next to the running interpreter, where pip
+    puts it when the environment's bin directory is not on PATH.
+    """
+    found = shutil.which("skill-seekers")
+    if found:
+        return found
+    
+    sibling = Path(sys.executable).parent / "skill-seekers"
+    if sibling.is_file():
+        return str(sibling)
+    
+    return None
 
 
 def _install_skill_seekers() -> bool:
-    """Install skill-seekers package."""
+    """Install skill-seekers package into the running interpreter."""
     try:
         subprocess.run(
-            ["pip", "install", "skill-seekers"],
+            [sys.executable, "-m", "pip", "install", "skill-seekers"],
             check=True,
             capture_output=True
         )
-        return True
     except subprocess.CalledProcessError:
         return False
+    
+    importlib.invalidate_caches()
+    _check_skill_seekers.cache_clear()
+    _skill_seekers_executable.cache_clear()
+    return True
+
+
+# Prefix of the per-run scratch directory created inside the install base
+# while skill-seekers runs
+_WORK_DIR_PREFIX = ".skillio-work-"
+
+# skill-seekers github --repo owner/repo --name skill-name
+_SKILL_SEEKERS_GITHUB_ARGS = ("github",)
+_SKILL_SEEKERS_FLAGS = ("--non-interactive",)  # Fail fast on rate limits
+_SKILL_SEEKERS_ENHANCE_FLAGS = ("--enhance-local",)
 
 
 def _get_installed_skills_registry() -> Path:
@@ -161,24 +253,81 @@ def _get_installed_skills_registry() -> Path:
     return _get_default_install_path().parent / "installed_skills.json"
 
 
+# In-process copy of the registry, reused while the file's mtime is unchanged
+_REGISTRY_CACHE: Optional[dict] = None
+_REGISTRY_PATH: Optional[Path] = None
+_REGISTRY_MTIME: Optional[int] = None
+
+
 def _load_installed_registry() -> dict:
-    """Load the installed skills registry."""
+    """Load the installed skills registry.
+    
+    The parsed registry is cached and returned as-is while the file is
+    unchanged on disk; save any change with _save_installed_registry().
+    """
+    global _REGISTRY_CACHE, _REGISTRY_PATH, _REGISTRY_MTIME
     registry_path = _get_installed_skills_registry()
     
-    if not registry_path.exists():
+    try:
+        mtime = registry_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {"skills": {}}
     
-    with open(registry_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    if (
+        _REGISTRY_CACHE is not None
+        and _REGISTRY_PATH == registry_path
+        and _REGISTRY_MTIME == mtime
+    ):
+        return _REGISTRY_CACHE
+    
+    registry = _json_loads(registry_path.read_bytes())
+    
+    _REGISTRY_CACHE = registry
+    _REGISTRY_PATH = registry_path
+    _REGISTRY_MTIME = mtime
+    return registry
+
+
+def _set_registry_entry(registry: dict, skill_name: str, entry: dict) -> bool:
+    """Add or replace a skill entry in the registry.
+    
+    Returns:
+        False if an identical entry was already registered (e.g. a forced
+        reinstall of the same version), in which case nothing needs saving.
+    """
+    if registry["skills"].get(skill_name) == entry:
+        return False
+    
+    registry["skills"][skill_name] = entry
+    return True
 
 
 def _save_installed_registry(registry: dict):
-    """Save the installed skills registry."""
+    """Save the installed skills registry.
+    
+    The file is replaced atomically and the in-memory cache updated to
+    match. Always writes; callers skip unchanged registries themselves
+    (see _set_registry_entry()).
+    """
+    global _REGISTRY_CACHE, _REGISTRY_PATH, _REGISTRY_MTIME
     registry_path = _get_installed_skills_registry()
+    
     registry_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = registry_path.with_name(f"{registry_path.name}.{os.getpid()}.tmp")
     
-    with open(registry_path, "w", encoding="utf-8") as f:
-        json.dump(registry, f, indent=2)
+    try:
+        tmp_path.write_bytes(_json_dumps(registry))
+        os.replace(tmp_path, registry_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    
+    _REGISTRY_CACHE = registry
+    _REGISTRY_PATH = registry_path
+    _REGISTRY_MTIME = registry_path.stat().st_mtime_ns
 
 
 def install_skill(
@@ -186,7 +335,9 @@ def install_skill(
     target: Optional[str] = None,
     force: bool = False,
     use_skill_seekers: bool = True,
-    enhance: bool = True
+    enhance: bool = True,
+    install_seekers: bool = False,
+    skill: Optional[dict] = None
 ) -> dict:
     """Install a skill.
     
@@ -199,12 +350,16 @@ def install_skill(
         force: Force reinstall if already installed
         use_skill_seekers: Use skill-seekers for GitHub sources (default: True)
         enhance: Run AI enhancement on generated Skill (default: True)
+        install_seekers: pip-install skill-seekers if it is missing
+            (default: False)
+        skill: Index entry for skill_name, if the caller already has it
     
     Returns:
         Result dict with success status and details
     """
     # Get skill info from index
-    skill = get_skill_info(skill_name)
+    if skill is None:
+        skill = get_skill_info(skill_name)
     if not skill:
         return {
             "success": False,
@@ -235,11 +390,15 @@ def install_skill(
         result = _install_with_skill_seekers(
             skill=skill,
             skill_path=skill_path,
-            enhance=enhance
+            enhance=enhance,
+            install_seekers=install_seekers
         )
         if not result["success"]:
-            # Fallback to simple generation
+            # Fallback to simple generation, telling the caller why
+            note = f"Fell back to simple installation: {result['error']}"
             result = _install_simple(skill, skill_path)
+            if result["success"]:
+                result["note"] = note
     else:
         # For non-GitHub sources, use simple generation
         result = _install_simple(skill, skill_path)
@@ -247,29 +406,32 @@ def install_skill(
     if not result["success"]:
         return result
     
-    # Update registry
-    registry["skills"][skill_name] = {
+    # Update registry, skipping the write for an unchanged reinstall
+    entry = {
         "version": skill.get("version", "1.0.0"),
         "path": str(skill_path),
         "source": source,
         "installed_at": str(Path.cwd()),
         "method": result.get("method", "simple")
     }
-    _save_installed_registry(registry)
+    if _set_registry_entry(registry, skill_name, entry):
+        _save_installed_registry(registry)
     
     return {
         "success": True,
         "path": str(skill_path),
         "version": skill.get("version", "1.0.0"),
         "method": result.get("method", "simple"),
-        "contents": result.get("contents", [])
+        "contents": result.get("contents", []),
+        "note": result.get("note")
     }
 
 
 def _install_with_skill_seekers(
     skill: dict,
     skill_path: Path,
-    enhance: bool = True
+    enhance: bool = True,
+    install_seekers: bool = False
 ) -> dict:
     """Install a skill using skill-seekers for high-quality generation.
     
@@ -277,6 +439,7 @@ def _install_with_skill_seekers(
         skill: Skill metadata dict
         skill_path: Target installation path
         enhance: Whether to run AI enhancement
+        install_seekers: Whether to pip-install skill-seekers if missing
     
     Returns:
         Result dict with success status
@@ -293,95 +456,135 @@ def _install_with_skill_seekers(
     
     # Check/install skill-seekers
     if not _check_skill_seekers():
+        if not install_seekers:
+            return {
+                "success": False,
+                "error": (
+                    "skill-seekers is not installed. Re-run with --install-seekers "
+                    "or run: pip install skill-seekers"
+                )
+            }
         if not _install_skill_seekers():
             return {
                 "success": False,
                 "error": "Failed to install skill-seekers. Please run: pip install skill-seekers"
             }
     
-    # Create temp directory for generation
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # skill-seekers outputs to ./output/ by default
-        work_dir = Path(temp_dir)
+    # Generate next to the install target so the result can be renamed
+    # into place instead of copied across filesystems. Each run gets its
+    # own directory, so concurrent installs don't clobber each other.
+    try:
+        skill_path.parent.mkdir(parents=True, exist_ok=True)
+        work_dir = Path(tempfile.mkdtemp(prefix=_WORK_DIR_PREFIX, dir=skill_path.parent))
+    except OSError as e:
+        return {
+            "success": False,
+            "error": f"skill-seekers error: {str(e)}"
+        }
+    
+    try:
+        # Step 1: Generate skill from GitHub
+        cmd = (
+            _skill_seekers_executable() or "skill-seekers", *_SKILL_SEEKERS_GITHUB_ARGS,
+            "--repo", repo,
+            "--name", skill_name,
+            *_SKILL_SEEKERS_FLAGS
+        )
         
-        try:
-            # Step 1: Generate skill from GitHub
-            # skill-seekers github --repo owner/repo --name skill-name
-            cmd = [
-                "skill-seekers", "github",
-                "--repo", repo,
-                "--name", skill_name,
-                "--non-interactive"  # Fail fast on rate limits
-            ]
-            
-            # Add enhance flag if requested
-            if enhance:
-                cmd.append("--enhance-local")
-            
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minutes timeout
-                cwd=str(work_dir)  # Run in temp directory
-            )
-            
-            # skill-seekers outputs to ./output/<name>/
-            output_dir = work_dir / "output" / skill_name
-            
-            # Also check for repo-based naming (e.g., output/yt-dlp/)
-            if not output_dir.exists():
-                # Try to find any output directory
-                output_base = work_dir / "output"
-                if output_base.exists():
-                    for item in output_base.iterdir():
-                        if item.is_dir() and item.name != "__pycache__":
-                            output_dir = item
-                            break
-            
-            if result.returncode != 0 and not output_dir.exists():
-                error_msg = result.stderr or result.stdout or "Unknown error"
-                return {
-                    "success": False,
-                    "error": f"skill-seekers failed: {error_msg[:200]}"
-                }
-            
-            if not output_dir.exists():
-                return {
-                    "success": False,
-                    "error": "skill-seekers did not generate output directory"
-                }
-            
-            # Step 2: Move to target location
-            skill_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            if skill_path.exists():
-                shutil.rmtree(skill_path)
-            
-            shutil.move(str(output_dir), str(skill_path))
-            
-            # List generated contents
-            contents = []
-            for item in skill_path.rglob("*"):
-                if item.is_file():
-                    contents.append(str(item.relative_to(skill_path)))
-            
-            return {
-                "success": True,
-                "method": "skill-seekers",
-                "contents": sorted(contents)[:20]  # Limit to first 20 files
-            }
-            
-        except subprocess.TimeoutExpired:
+        # Add enhance flag if requested
+        if enhance:
+            cmd += _SKILL_SEEKERS_ENHANCE_FLAGS
+        
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            text=True,
+            timeout=600,  # 10 minutes timeout
+            cwd=str(work_dir)  # skill-seekers outputs to ./output/ by default
+        )
+        
+        # skill-seekers outputs to ./output/<name>/
+        output_dir = work_dir / "output" / skill_name
+        
+        # Also check for repo-based naming (e.g., output/yt-dlp/)
+        if not output_dir.exists():
+            # Try to find any output directory
+            output_base = work_dir / "output"
+            if output_base.exists():
+                with os.scandir(output_base) as entries:
+                    entry = next(
+                        (e for e in entries if e.is_dir() and e.name != "__pycache__"),
+                        None
+                    )
+                if entry is not None:
+                    output_dir = Path(entry.path)
+        
+        if result.returncode != 0 and not output_dir.exists():
+            error_msg = result.stderr or result.stdout or "Unknown error"
             return {
                 "success": False,
-                "error": "skill-seekers timed out (10min). Try with --no-seekers flag."
+                "error": f"skill-seekers failed: {error_msg[:200]}"
             }
-        except Exception as e:
+        
+        if not output_dir.exists():
             return {
                 "success": False,
-                "error": f"skill-seekers error: {str(e)}"
+                "error": "skill-seekers did not generate output directory"
             }
+        
+        # Step 2: Move to target location
+        if skill_path.exists():
+            shutil.rmtree(skill_path)
+        
+        try:
+            os.rename(output_dir, skill_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(output_dir), str(skill_path))
+        
+        # List generated contents (the first 20 files in sorted order)
+        contents = list(itertools.islice(_iter_files(skill_path), 20))
+        
+        return {
+            "success": True,
+            "method": "skill-seekers",
+            "contents": contents
+        }
+        
+    except subprocess.TimeoutExpired:
+        return {
+            "success": False,
+            "error": "skill-seekers timed out (10min). Try with --no-seekers flag."
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"skill-seekers error: {str(e)}"
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _iter_files(root: Path, prefix: str = ""):
+    """Yield the file paths under root, relative to it, in sorted order.
+    
+    Files and subdirectories are visited as one sorted sequence, with a
+    directory keyed by its name plus a separator (every path inside it
+    starts with that), so paths come out exactly as sorted() would order
+    them. Callers can stop early instead of listing the whole tree.
+    """
+    with os.scandir(root) as it:
+        entries = sorted(
+            (entry.name + os.sep if entry.is_dir(follow_symlinks=False) else entry.name, entry)
+            for entry in it
+        )
+    
+    for key, entry in entries:
+        if key.endswith(os.sep):
+            yield from _iter_files(entry.path, prefix + key)
+        elif entry.is_file():
+            yield prefix + key
 
 
 def _install_simple(skill: dict, skill_path: Path) -> dict:
@@ -411,77 +614,88 @@ def _install_simple(skill: dict, skill_path: Path) -> dict:
         }
 
 
-def _generate_skill_md(skill: dict) -> str:
-    """Generate SKILL.md content for a skill."""
-    
-    # Build capabilities list
-    capabilities = "\n".join(f"- {cap}" for cap in skill.get("capabilities", []))
-    
-    # Build scenarios list
-    scenarios = "\n".join(f"- {s}" for s in skill.get("scenarios", []))
-    
-    # Build dependencies
-    deps = skill.get("dependencies", [])
-    deps_section = ""
-    if deps:
-        deps_list = "\n".join(f"- {d}" for d in deps)
-        deps_section = f"""
-## Prerequisites
-
-{deps_list}
-"""
-    
-    # Get source info
-    source = skill.get("source", {})
-    source_type = source.get("type", "unknown")
-    source_info = ""
-    
-    if source_type == "github":
-        repo = source.get("repo", "")
-        source_info = f"""
-## Source
-
-- GitHub: https://github.com/{repo}
-- Type: {source_type}
-"""
-    
-    content = f"""---
-name: {skill['name']}
-description: {skill['description']}
+# SKILL.md templates, compiled once at import time
+_SKILL_MD_TEMPLATE = string.Template("""---
+name: ${name}
+description: ${description}
 ---
 
-# {skill['name']}
+# ${name}
 
-{skill['description']}
+${description}
 
-{skill.get('description_zh', '')}
+${description_zh}
 
 ## Capabilities
 
-{capabilities}
+${capabilities}
 
 ## Usage Scenarios
 
-{scenarios}
-{deps_section}{source_info}
+${scenarios}
+${deps_section}${source_info}
 ## Quick Start
 
 ```bash
 # Installation handled by Skillio
-skillio install {skill['name']}
+skillio install ${name}
 ```
 
 ## Notes
 
-- Quality Score: {skill.get('quality_score', 'N/A')}/10
-- License: {skill.get('license', 'Unknown')}
+- Quality Score: ${quality_score}/10
+- License: ${license}
 
 ---
 
 *Generated by Skillio v0.1.0*
-"""
+""")
+
+_SKILL_MD_DEPS_TEMPLATE = string.Template("""
+## Prerequisites
+
+${deps_list}
+""")
+
+_SKILL_MD_SOURCE_TEMPLATE = string.Template("""
+## Source
+
+- GitHub: https://github.com/${repo}
+- Type: ${source_type}
+""")
+
+
+def _generate_skill_md(skill: dict) -> str:
+    """Generate SKILL.md content for a skill."""
     
-    return content
+    # Build dependencies
+    deps = skill.get("dependencies", [])
+    deps_section = ""
+    if deps:
+        deps_section = _SKILL_MD_DEPS_TEMPLATE.substitute(deps_list=bullet_list(deps))
+    
+    # Get source info
+    source = skill.get("source", {})
+    source_type = source.get("type", "unknown")
+    source_info = ""
+    
+    if source_type == "github":
+        source_info = _SKILL_MD_SOURCE_TEMPLATE.substitute(
+            repo=source.get("repo", ""),
+            source_type=source_type
+        )
+    
+    return _SKILL_MD_TEMPLATE.substitute(
+        name=skill["name"],
+        description=skill["description"],
+        description_zh=skill.get("description_zh", ""),
+        capabilities=bullet_list(skill.get("capabilities", [])),
+        scenarios=bullet_list(skill.get("scenarios", [])),
+        deps_section=deps_section,
+        source_info=source_info,
+        quality_score=skill.get("quality_score", "N/A"),
+        license=skill.get("license", "Unknown")
+    )
 
 
 def list_installed() -> list:
@@ -491,24 +705,26 @@ def list_installed() -> list:
         List of installed skill info dicts
     """
     registry = _load_installed_registry()
+    skills = registry.get("skills", {})
     
-    installed = []
-    for name, info in registry.get("skills", {}).items():
-        # Get full skill info
-        skill = get_skill_info(name)
-        if skill:
-            skill["installed_path"] = info.get("path")
-            installed.append(skill)
-        else:
-            # Skill removed from index but still installed
-            installed.append({
-                "name": name,
-                "version": info.get("version", "unknown"),
-                "description": "(Skill removed from index)",
-                "installed_path": info.get("path")
-            })
+    # Get full skill info for every installed skill in one index lookup
+    index = get_skill_infos(skills)
     
-    return installed
+    return [_installed_entry(name, info, index.get(name)) for name, info in skills.items()]
+
+
+def _installed_entry(name: str, info: dict, skill: Optional[dict]) -> dict:
+    """Combine a registry entry with its index metadata, if still indexed."""
+    if skill:
+        return {**skill, "installed_path": info.get("path")}
+    
+    # Skill removed from index but still installed
+    return {
+        "name": name,
+        "version": info.get("version", "unknown"),
+        "description": "(Skill removed from index)",
+        "installed_path": info.get("path")
+    }
 
 
 def remove_skill(skill_name: str) -> dict:
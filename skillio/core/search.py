@@ -4,81 +4,320 @@ Skillio Search Engine
 Handles intent understanding and skill matching.
 """
 
+import heapq
+import math
 import os
+import pickle
 import re
+import sys
+from collections import Counter, defaultdict
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 
-import yaml
+# Word tokenizer, compiled once instead of looked up in re's cache per call
+_WORD_RE = re.compile(r'\w+')
 
 
-def _load_skills_index() -> list:
-    """Load the skills index from YAML file."""
-    index_path = Path(__file__).parent.parent / "index" / "skills.yaml"
+_INDEX_PATH = Path(__file__).parent.parent / "index" / "skills.yaml"
+
+# Loaded index per path, as (mtime_ns, size, entry); see _build_index()
+_INDEX_CACHE: Dict[Path, Tuple[int, int, dict]] = {}
+
+
+def _tokenize(text: str) -> list:
+    """Split text into word tokens, exactly like _WORD_RE.findall(text).
     
-    if not index_path.exists():
-        return []
+    Most index phrases are plain space-separated words, for which str.split()
+    gives the same tokens much faster than the regex engine. \\w matches
+    str.isalnum() characters plus "_", so the regex is only needed when a
+    chunk contains anything else (punctuation, underscores).
+    """
+    parts = text.split()
+    for part in parts:
+        if not part.isalnum():
+            return _WORD_RE.findall(text)
+    return parts
+
+
+def _word_set(text: str) -> frozenset:
+    """Lowercased word tokens of text, interned (see search_skills())."""
+    return frozenset(map(sys.intern, _tokenize(text.lower())))
+
+
+def _prepare_skill(skill: dict) -> dict:
+    """Precompute the lowercased fields and word sets used for scoring."""
+    return {
+        "name_l": skill["name"].lower(),
+        "desc_l": skill.get("description", "").lower(),
+        "desc_zh_l": skill.get("description_zh", "").lower(),
+        "desc_word_sets": [
+            _word_set(skill.get("description", "")),
+            _word_set(skill.get("description_zh", "")),
+        ],
+        "cap_word_sets": [_word_set(c) for c in skill.get("capabilities", [])],
+        "scen_word_sets": [_word_set(s) for s in skill.get("scenarios", [])],
+        "tags_l": [t.lower() for t in skill.get("tags", [])],
+        # ±25% based on quality
+        "quality_mult": 1 + (skill.get("quality_score", 5.0) - 5) / 20,
+        "orig": skill,
+    }
+
+
+# Score added per query word found in a description / capability / scenario,
+# and per matching tag. Description words are only supporting evidence: the
+# whole-phrase description match below still earns its own bonus.
+_DESCRIPTION_WEIGHT = 0.5
+_CAPABILITY_WEIGHT = 1.5
+_SCENARIO_WEIGHT = 1.0
+_TAG_WEIGHT = 0.5
+
+
+def _add_postings(postings: dict, idx: int, record: dict):
+    """Add one skill's description, capability and scenario words to the postings.
+    
+    Each token maps to [(skill index, weight)], where weight already sums
+    every description (0.5), capability (1.5) and scenario (1.0) of the skill
+    containing it, so scoring a query word is a single dict lookup.
+    """
+    per_token = {}
+    for word_sets, weight in (
+        (record["desc_word_sets"], _DESCRIPTION_WEIGHT),
+        (record["cap_word_sets"], _CAPABILITY_WEIGHT),
+        (record["scen_word_sets"], _SCENARIO_WEIGHT),
+    ):
+        for words in word_sets:
+            for word in words:
+                per_token[word] = per_token.get(word, 0.0) + weight
+    for word, total in per_token.items():
+        postings.setdefault(word, []).append((idx, total))
+
+
+# Floor of the IDF factor, so a word every skill shares still counts for half
+_MIN_IDF_FACTOR = 0.5
+
+
+def _apply_idf(postings: dict, n_skills: int):
+    """Scale posting weights down for words that many skills share.
+    
+    Uses the smoothed IDF log((1 + N) / (1 + df)) + 1, normalized so that a
+    word unique to one skill keeps its full weight, and bounded below by
+    _MIN_IDF_FACTOR so scores stay in the range min_score was tuned for.
+    """
+    max_idf = math.log((1 + n_skills) / 2) + 1
+    for word, entries in postings.items():
+        idf = math.log((1 + n_skills) / (1 + len(entries))) + 1
+        factor = _MIN_IDF_FACTOR + (1 - _MIN_IDF_FACTOR) * idf / max_idf
+        postings[word] = [(idx, weight * factor) for idx, weight in entries]
+
+
+def _build_categories(skills: list) -> list:
+    """Category info dicts sorted by name, with up to 5 example skills each."""
+    # Collect all tags, keeping at most 5 example skills per tag
+    counts = Counter()
+    examples = defaultdict(list)
+    for skill in skills:
+        for tag in skill.get("tags", ()):
+            counts[tag] += 1
+            tag_examples = examples[tag]
+            if len(tag_examples) < 5:
+                tag_examples.append(skill["name"])
+    
+    return [
+        {"name": cat, "count": count, "examples": examples[cat]}
+        for cat, count in sorted(counts.items())
+    ]
+
+
+def _build_index(skills: list) -> dict:
+    """Build the cached index entry for a freshly parsed skills list.
+    
+    Besides the per-skill records, this builds inverted indexes so a query
+    only touches the skills that share a token (or tag) with it.
+    """
+    prepared = [_prepare_skill(skill) for skill in skills]
+    
+    word_postings = {}
+    tag_postings = {}
+    name_to_idx = {}
+    by_name = {}
+    by_category = defaultdict(list)
+    for idx, record in enumerate(prepared):
+        _add_postings(word_postings, idx, record)
+        for tag in record["tags_l"]:
+            tag_postings.setdefault(tag, []).append(idx)
+        name_to_idx.setdefault(record["name_l"], idx)
+        by_name.setdefault(skills[idx]["name"], skills[idx])
+        for tag in dict.fromkeys(record["tags_l"]):
+            by_category[tag].append(skills[idx])
+    _apply_idf(word_postings, len(prepared))
+    
+    return {
+        "skills": skills,
+        "prepared": prepared,
+        "word_postings": word_postings,
+        "tag_postings": tag_postings,
+        "name_to_idx": name_to_idx,
+        "by_name": by_name,
+        "by_category": dict(by_category),
+        "categories": _build_categories(skills),
+    }
+
+
+# Bump when the sidecar layout changes so stale caches are ignored
+_SIDECAR_VERSION = 1
+
+
+def _sidecar_path(index_path: Path) -> Path:
+    """Path of the pickled copy of a parsed index (e.g. skills.yaml.cache.pkl)."""
+    return index_path.with_name(index_path.name + ".cache.pkl")
+
+
+def _read_index_sidecar(index_path: Path, source: tuple) -> Optional[list]:
+    """Return the skills from the sidecar cache if it matches the YAML's (mtime, size)."""
+    try:
+        with open(_sidecar_path(index_path), "rb") as f:
+            cached = pickle.load(f)
+    except Exception:  # Missing, unreadable or corrupt cache
+        return None
+    
+    if (
+        not isinstance(cached, dict)
+        or cached.get("version") != _SIDECAR_VERSION
+        or cached.get("source") != source
+    ):
+        return None
+    
+    return cached["skills"]
+
+
+def _write_index_sidecar(index_path: Path, source: tuple, skills: list):
+    """Save parsed skills next to the YAML so later processes can skip parsing."""
+    sidecar = _sidecar_path(index_path)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    payload = {"version": _SIDECAR_VERSION, "source": source, "skills": skills}
+    
+    try:
+        with open(tmp_path, "wb") as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+    except OSError:
+        # e.g. a read-only install; the YAML is simply parsed every run
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _parse_index_yaml(index_path: Path) -> list:
+    """Parse the skills list out of the YAML index.
+    
+    PyYAML is imported here rather than at module level: it is only needed
+    when the sidecar cache is stale, so most commands never pay for it.
+    """
+    import yaml
     
-    with open(index_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    # Prefer the libyaml-backed loader, which parses ~10x faster
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
     
+    # Binary mode lets the YAML reader detect and decode the encoding itself
+    with open(index_path, "rb") as f:
+        data = yaml.load(f, Loader=Loader)
     return data.get("skills", [])
 
 
-def _calculate_match_score(skill: dict, query: str, keyword_mode: bool = False) -> float:
-    """Calculate relevance score between a skill and query.
+def _load_index() -> dict:
+    """Load the skills index from YAML file, with derived search structures.
     
-    In keyword mode, uses simple text matching.
-    In intent mode, uses capability and scenario matching.
+    The entry is cached and only rebuilt when the file's mtime or size
+    changes. Callers must treat everything in it as read-only. The parsed
+    YAML is also kept in a pickled sidecar file, so a new process only has
+    to re-parse the YAML after it has been edited.
     """
-    query_lower = query.lower()
-    score = 0.0
-    
-    # Exact name match
-    if skill["name"].lower() == query_lower:
-        return 10.0
-    
-    # Name partial match
-    if query_lower in skill["name"].lower():
-        score += 5.0
-    
-    # Description match
-    if query_lower in skill.get("description", "").lower():
-        score += 2.0
-    
-    if query_lower in skill.get("description_zh", "").lower():
-        score += 2.0
-    
-    # Split query into words
-    query_words = set(re.findall(r'\w+', query_lower))
-    
-    # Capability matching (most important for intent mode)
-    capabilities = [c.lower() for c in skill.get("capabilities", [])]
-    for cap in capabilities:
-        cap_words = set(re.findall(r'\w+', cap))
-        overlap = len(query_words & cap_words)
-        if overlap > 0:
-            score += overlap * 1.5
-    
-    # Scenario matching
-    scenarios = [s.lower() for s in skill.get("scenarios", [])]
-    for scenario in scenarios:
-        scenario_words = set(re.findall(r'\w+', scenario))
-        overlap = len(query_words & scenario_words)
-        if overlap > 0:
-            score += overlap * 1.0
+    index_path = _INDEX_PATH
+    
+    try:
+        st = os.stat(index_path)
+    except FileNotFoundError:
+        return _build_index([])
+    
+    cached = _INDEX_CACHE.get(index_path)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    
+    source = (st.st_mtime_ns, st.st_size)
+    skills = _read_index_sidecar(index_path, source)
+    if skills is None:
+        skills = _parse_index_yaml(index_path)
+        _write_index_sidecar(index_path, source, skills)
+    
+    entry = _build_index(skills)
+    _INDEX_CACHE[index_path] = (st.st_mtime_ns, st.st_size, entry)
+    return entry
+
+
+def _score_skills(index: dict, query_lower: str, query_words: frozenset) -> list:
+    """Calculate relevance scores between every skill and the query.
+    
+    Args:
+        index: Index entry from _load_index()
+        query_lower: The lowercased query
+        query_words: Word tokens of query_lower
+    
+    Returns:
+        List of scores, parallel to index["skills"]
+    """
+    prepared_skills = index["prepared"]
+    scores = [0.0] * len(prepared_skills)
+    
+    # Exact name match scores 10.0 outright, so it is skipped below
+    exact = index["name_to_idx"].get(query_lower)
+    
+    # Description words are scored through the postings. Whole-phrase matches
+    # are only worth a substring scan for multi-word queries, or for text that
+    # isn't space-separated (e.g. Chinese), where tokens can't find it.
+    phrase_match = len(query_words) > 1 or not query_lower.isascii()
+    
+    for idx, prepared in enumerate(prepared_skills):
+        if idx == exact:
+            continue
+        
+        # Name partial match
+        if query_lower in prepared["name_l"]:
+            scores[idx] += 5.0
+        
+        # Description phrase match
+        if phrase_match:
+            if query_lower in prepared["desc_l"]:
+                scores[idx] += 2.0
+            
+            if query_lower in prepared["desc_zh_l"]:
+                scores[idx] += 2.0
+    
+    # Description, capability (most important for intent mode) and scenario matching
+    word_postings = index["word_postings"]
+    for word in query_words:
+        for idx, weight in word_postings.get(word, ()):
+            scores[idx] += weight
     
     # Tag matching
-    tags = [t.lower() for t in skill.get("tags", [])]
-    for tag in tags:
+    for tag, indexes in index["tag_postings"].items():
         if tag in query_lower or any(word in tag for word in query_words):
-            score += 0.5
+            for idx in indexes:
+                scores[idx] += _TAG_WEIGHT
+    
+    # Quality score boost, only for skills that matched at all
+    for idx, score in enumerate(scores):
+        if score:
+            scores[idx] = round(score * prepared_skills[idx]["quality_mult"], 2)
     
-    # Quality score boost
-    quality = skill.get("quality_score", 5.0)
-    score *= (1 + (quality - 5) / 20)  # ±25% based on quality
+    if exact is not None:
+        scores[exact] = 10.0
     
-    return round(score, 2)
+    return scores
 
 
 def search_skills(
@@ -98,24 +337,25 @@ def search_skills(
     Returns:
         List of matching skills with match scores
     """
-    skills = _load_skills_index()
+    index = _load_index()
+    skills = index["skills"]
     
     if not skills:
         return []
     
-    # Calculate scores for all skills
-    scored_skills = []
-    for skill in skills:
-        score = _calculate_match_score(skill, query, keyword_mode)
-        if score >= min_score:
-            skill_copy = skill.copy()
-            skill_copy["match_score"] = score
-            scored_skills.append(skill_copy)
+    # Tokenize the query once for all skills. Index tokens are interned too,
+    # so postings lookups match on identity instead of comparing strings
+    query_lower = query.lower()
+    query_words = frozenset(map(sys.intern, _tokenize(query_lower)))
     
-    # Sort by score descending
-    scored_skills.sort(key=lambda x: x["match_score"], reverse=True)
+    # Calculate scores for all skills
+    scores = _score_skills(index, query_lower, query_words)
+    candidates = ((idx, score) for idx, score in enumerate(scores) if score >= min_score)
     
-    return scored_skills[:limit]
+    # Keep the top `limit` by score (ties stay in index order), and only
+    # copy those skills to attach their match score
+    top = heapq.nlargest(limit, candidates, key=itemgetter(1))
+    return [{**skills[idx], "match_score": score} for idx, score in top]
 
 
 def get_skill_info(skill_name: str) -> Optional[dict]:
@@ -127,13 +367,23 @@ def get_skill_info(skill_name: str) -> Optional[dict]:
     Returns:
         Skill information dict or None if not found
     """
-    skills = _load_skills_index()
+    return _load_index()["by_name"].get(skill_name)
+
+
+def get_skill_infos(skill_names: Iterable[str]) -> dict:
+    """Get information about several skills with a single index load.
     
-    for skill in skills:
-        if skill["name"] == skill_name:
-            return skill
+    Args:
+        skill_names: Names of the skills to look up (any iterable, e.g.
+            the registry's skills dict)
     
-    return None
+    Returns:
+        Dict mapping each found skill name to its information dict.
+        Names not in the index are omitted.
+    """
+    by_name = _load_index()["by_name"]
+    
+    return {name: by_name[name] for name in skill_names if name in by_name}
 
 
 def get_all_skills(category: Optional[str] = None) -> list:
@@ -145,16 +395,13 @@ def get_all_skills(category: Optional[str] = None) -> list:
     Returns:
         List of skills
     """
-    skills = _load_skills_index()
+    index = _load_index()
     
+    # Copy so callers can't reorder the cached index
     if category:
-        category_lower = category.lower()
-        skills = [
-            s for s in skills
-            if category_lower in [t.lower() for t in s.get("tags", [])]
-        ]
+        return list(index["by_category"].get(category.lower(), ()))
     
-    return skills
+    return list(index["skills"])
 
 
 def get_categories() -> list:
@@ -163,23 +410,6 @@ def get_categories() -> list:
     Returns:
         List of category info dicts
     """
-    skills = _load_skills_index()
-    
-    # Collect all tags
-    category_skills = {}
-    for skill in skills:
-        for tag in skill.get("tags", []):
-            if tag not in category_skills:
-                category_skills[tag] = []
-            category_skills[tag].append(skill["name"])
-    
-    # Build category list
-    categories = []
-    for cat, skill_names in sorted(category_skills.items()):
-        categories.append({
-            "name": cat,
-            "count": len(skill_names),
-            "examples": skill_names[:5]
-        })
-    
-    return categories
+    # Built with the index (see _build_categories()); copy the list so
+    # callers can't reorder the cached one
+    return list(_load_index()["categories"])